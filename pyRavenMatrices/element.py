@@ -27,16 +27,56 @@ modifier_sequence :: element_modifier {element_modifier}
 
 
 import abc
-from typing import Callable, Dict, List, Any, Union
+import copy
+import functools
+import operator
+from typing import Callable, Dict, List, Any, Sequence, Tuple, Union
 import cairo
 from pyRavenMatrices.matrix import CellStructure 
 
+# Placeholder for unset slots when comparing element nodes.
+_UNSET = object()
+
 class ElementNode(abc.ABC):
-    '''Represents a generic node in element structure syntax.'''
+    '''Represents a generic node in element structure syntax.
+    
+    Element node classes declare ``__slots__``, so instances have no 
+    ``__dict__`` unless a subclass omits ``__slots__``.
+    '''
+
+    __slots__ = ()
+
+    # Names of all slots declared in the class hierarchy, a getter returning 
+    # their values as a tuple, and whether instances have a __dict__. Set per 
+    # subclass by __init_subclass__.
+    _fields : Tuple[str, ...] = ()
+    _get_fields : Callable[[Any], Tuple[Any, ...]] = staticmethod(
+        lambda node: ()
+    )
+    _has_dict = False
+
+    def __init_subclass__(cls, **kwargs : Any) -> None:
+
+        super().__init_subclass__(**kwargs)
+        fields : List[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in ('__dict__', '__weakref__', *fields):
+                    fields.append(name)
+        cls._fields = tuple(fields)
+        if len(fields) > 1:
+            cls._get_fields = staticmethod(operator.attrgetter(*fields))
+        elif fields:
+            getter = operator.attrgetter(fields[0])
+            cls._get_fields = staticmethod(lambda node: (getter(node),))
+        cls._has_dict = cls.__dictoffset__ != 0
 
     def __repr__(self):
 
-        return ''.join([type(self).__name__, '(', repr(vars(self)), ')'])
+        return ''.join([type(self).__name__, '(', repr(self._state()), ')'])
 
     def __eq__(self, other : Any) -> bool:
         '''Return ``True`` if ``other`` is equal to ``self``.
@@ -44,14 +84,56 @@ class ElementNode(abc.ABC):
         ``self == other`` iff:
 
         - ``type(self) == type(other)`` and
-        - ``vars(self) == vars(other)`` 
+        - ``self._values() == other._values()`` 
         '''
 
         return (
             type(self) == type(other) and
-            vars(self) == vars(other)
+            self._values() == other._values()
         )
 
+    def _values(self) -> Tuple[Any, ...]:
+        '''Return the values of all slots of ``self``, then its ``__dict__``.
+        
+        Unset slots are represented by ``_UNSET``.
+        '''
+
+        try:
+            values = self._get_fields(self)
+        except AttributeError:
+            values = tuple(
+                [getattr(self, name, _UNSET) for name in self._fields]
+            )
+        if self._has_dict:
+            return values + (self.__dict__,)
+        return values
+
+    def _shallow_copy(self) -> 'ElementNode':
+        '''Return a new node with the same attributes as ``self``.
+
+        ``__init__`` is bypassed. Dict-valued attributes (e.g., params) are 
+        copied; all other attribute values are shared with ``self``.
+        '''
+
+        output = type(self).__new__(type(self))
+        for name, val in self._state().items():
+            setattr(output, name, dict(val) if isinstance(val, dict) else val)
+        return output
+
+    def _state(self) -> Dict[str, Any]:
+        '''Return a dict of the attributes set on ``self``.
+
+        Covers slots declared anywhere in the class hierarchy as well as 
+        ``__dict__``, if present. Unset slots are omitted.
+        '''
+
+        state : Dict[str, Any] = {
+            name: getattr(self, name) 
+            for name in self._fields if hasattr(self, name)
+        }
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
 
 class Element(ElementNode):
     '''Represents an identifiable figure segment.
@@ -59,6 +141,8 @@ class Element(ElementNode):
     ``Element`` is an abstract base class. It cannot be directly instantiated.
     '''
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def draw_in_context(
         self, ctx : cairo.Context, cell_structure : CellStructure
@@ -69,10 +153,22 @@ class Element(ElementNode):
         '''
         pass
 
+    def clone(self) -> 'Element':
+        '''Return a copy of ``self``.
+
+        Subelements and modifiers are cloned recursively. The default 
+        implementation falls back on ``copy.deepcopy``; subclasses should 
+        override it with a cheaper copy where possible.
+        '''
+
+        return copy.deepcopy(self)
+
     
 class ElementModifier(ElementNode):
     '''Represents an alteration of the drawing procedure for a given element.
     '''
+
+    __slots__ = ('_decorator', '_params')
     
     def __call__(
         self, routine : Callable[[cairo.Context, CellStructure], None]
@@ -87,6 +183,15 @@ class ElementModifier(ElementNode):
         
         return self.decorator(routine, **self.params)
 
+    def clone(self) -> 'ElementModifier':
+        '''Return a copy of ``self``.
+        
+        The decorator and any other attributes are shared with ``self``; the 
+        params dict is copied.
+        '''
+
+        return self._shallow_copy()
+
     @property
     def decorator(
         self
@@ -117,6 +222,8 @@ class ElementModifier(ElementNode):
 
 class BasicElement(Element):
     '''Represents an unanalyzed figural unit.'''
+
+    __slots__ = ('_routine', '_params')
     
     def draw_in_context(
         self, ctx : cairo.Context, cell_structure : CellStructure 
@@ -124,6 +231,15 @@ class BasicElement(Element):
 
         self.routine(ctx, cell_structure, **self.params)
 
+    def clone(self) -> 'BasicElement':
+        '''Return a copy of ``self``.
+        
+        The routine and any other attributes are shared with ``self``; the 
+        params dict is copied.
+        '''
+
+        return self._shallow_copy()
+
     @property
     def routine(self) -> Callable[..., None]:
         '''Drawing routine bound to ``self``.'''
@@ -149,12 +265,29 @@ class BasicElement(Element):
 
 class EmptyElement(Element):
     '''Represents an empty element.
+
+    ``EmptyElement`` is a singleton: instantiating it always returns the same 
+    object, so empty elements may be compared by identity.
     '''
 
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls) -> 'EmptyElement':
+
+        if cls.__dict__.get('_instance') is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __bool__(self):
         '''Always evaluates to ``False``.'''
         
         return False
+
+    def clone(self) -> 'EmptyElement':
+
+        return self
     
     def draw_in_context(
         self, ctx : cairo.Context, cell_structure : CellStructure
@@ -164,7 +297,11 @@ class EmptyElement(Element):
     
 class ModifiedElement(Element):
     '''Represents an element altered by a sequence of modifiers.
+    
+    Modifiers are stored as a tuple in ``self.modifiers``.
     '''
+
+    __slots__ = ('element', 'modifiers')
     
     def __init__(
         self, 
@@ -174,8 +311,14 @@ class ModifiedElement(Element):
     ) -> None:
         
         self.element = element
-        self.modifiers = [modifier]
-        self.modifiers.extend(modifiers)
+        self.modifiers = (modifier, *modifiers)
+
+    def clone(self) -> 'ModifiedElement':
+
+        output = self._shallow_copy()
+        output.element = self.element.clone()
+        output.modifiers = tuple([mod.clone() for mod in self.modifiers])
+        return output
     
     def draw_in_context(
         self, ctx : cairo.Context, cell_structure : CellStructure
@@ -190,14 +333,24 @@ class ModifiedElement(Element):
 
     
 class CompositeElement(Element):
-    '''Represents a sequence of overlayed elements.'''
+    '''Represents a sequence of overlayed elements.
+    
+    Subelements are stored as a tuple in ``self.elements``.
+    '''
+
+    __slots__ = ('elements',)
     
     def __init__(
         self, element_1 : Element, element_2 : Element, *elements : Element
     ) -> None:
         
-        self.elements = [element_1, element_2]
-        self.elements.extend(elements)
+        self.elements = (element_1, element_2, *elements)
+
+    def clone(self) -> 'CompositeElement':
+
+        output = self._shallow_copy()
+        output.elements = tuple([element.clone() for element in self.elements])
+        return output
         
     def draw_in_context(
         self, ctx : cairo.Context, cell_structure : CellStructure
@@ -207,23 +360,60 @@ class CompositeElement(Element):
             element.draw_in_context(ctx, cell_structure)
 
     
+@functools.singledispatch
+def _children(node : Any) -> Sequence[ElementNode]:
+    '''Return the immediate subtrees of ``node``.
+
+    Handlers are registered per node type with ``functools.singledispatch``, 
+    which resolves subclasses to their nearest registered base and caches the 
+    result, so each lookup costs a dict access instead of a chain of 
+    ``isinstance`` checks.
+
+    :raises TypeError: If no handler is registered for ``type(node)``.
+    '''
+
+    raise TypeError('Unexpected type {}'.format(str(type(node))))
+
+
+@_children.register(BasicElement)
+@_children.register(ElementModifier)
+def _no_children(node : ElementNode) -> Sequence[ElementNode]:
+
+    return ()
+
+
+@_children.register(ModifiedElement)
+def _modified_children(node : ModifiedElement) -> Sequence[ElementNode]:
+
+    return (node.element, *node.modifiers)
+
+
+@_children.register(CompositeElement)
+def _composite_children(node : CompositeElement) -> Sequence[ElementNode]:
+
+    return node.elements
+
+
 def get_subtrees(element : Element) -> List[Union[Element, ElementModifier]]:
-    '''Return a list of all unique subelements of element.'''
+    '''Return a list of all unique subelements of element.
+    
+    Uniqueness is structural (``==``). Each candidate is only compared against 
+    previously collected subtrees of the same type, and objects that have 
+    already been visited are skipped by identity.
+    '''
     
     output : List[Union[Element, ElementModifier]] = [element]
+    visited = {id(element)}
+    by_type : Dict[type, List[Union[Element, ElementModifier]]] = {
+        type(element): [element]
+    }
     for sub in output:
-        if isinstance(sub, BasicElement) or isinstance(sub, ElementModifier):
-            continue
-        elif isinstance(sub, ModifiedElement):
-            if not sub.element in output:
-                output.append(sub.element)
-            for mod in sub.modifiers:
-                if not mod in output:
-                    output.append(mod)
-        elif isinstance(sub, CompositeElement):
-            for subsub in sub.elements:
-                if not subsub in output:
-                    output.append(subsub)
-        else:
-            raise TypeError('Unexpected type {}'.format(str(type(sub))))
-    return output
\ No newline at end of file
+        for child in _children(sub):
+            if id(child) in visited:
+                continue
+            visited.add(id(child))
+            same_type = by_type.setdefault(type(child), [])
+            if not child in same_type:
+                same_type.append(child)
+                output.append(child)
+    return output
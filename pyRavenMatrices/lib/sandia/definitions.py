@@ -1,4 +1,5 @@
 import math
+import functools
 import cairo
 import os
 import typing as t
@@ -19,11 +20,152 @@ def _get_dims(cell_structure: mat.CellStructure) -> t.Tuple[int, int]:
     return width, height
 
 
+def _cached_path(shape: t.Callable[..., None]) -> t.Callable[..., None]:
+    """
+    Decorate a shape routine so that its path is built once and replayed.
+
+    The first call for a given cell geometry and set of shape parameters 
+    draws the shape into a scratch context and stores the resulting path. 
+    Every call, including the first, then appends the stored path to the 
+    current context with a single ``ctx.append_path``, instead of issuing 
+    each ``move_to``/``line_to`` through pycairo.
+
+    :param shape: Shape routine to decorate. It must only build a path.
+    """
+
+    @functools.lru_cache(maxsize=128)
+    def build(
+        width, height, horizontal_margin, vertical_margin, *args, **kwargs
+    ):
+
+        cell_structure = mat.CellStructure(
+            None, width, height, horizontal_margin, vertical_margin
+        )
+        surface = cairo.RecordingSurface(cairo.CONTENT_ALPHA, None)
+        ctx = cairo.Context(surface)
+        shape(ctx, cell_structure, *args, **kwargs)
+        return ctx.copy_path()
+
+    @functools.wraps(shape)
+    def wrapped(ctx, cell_structure, *args, **kwargs):
+
+        ctx.append_path(
+            build(
+                cell_structure.width, 
+                cell_structure.height, 
+                cell_structure.horizontal_margin,
+                cell_structure.vertical_margin,
+                *args, 
+                **kwargs
+            )
+        )
+
+    return wrapped
+
+
+# Shape outlines as (x, y) fractions of the drawable width and height, 
+# relative to the center of the cell.
+_OUTLINES: t.Dict[str, t.Tuple[t.Tuple[float, float], ...]] = {
+    'triangle': ((-1/2, 1/2), (1/2, 1/2), (0, -1/2), (-1/2, 1/2)),
+    'rectangle': (
+        (-1/2, 1/2), (1/2, 1/2), (1/2, -1/2), (-1/2, -1/2), (-1/2, 1/2)
+    ),
+    'trapezoid': (
+        (-1/2, 1/2), (1/2, 1/2), (1/4, -1/2), (-1/4, -1/2), (-1/2, 1/2)
+    ),
+    'diamond': ((0, 1/2), (1/2, -1/4), (0, -1/2), (-1/2, -1/4), (0, 1/2)),
+    'tee': (
+        (-1/6, 1/2), (1/6, 1/2), (1/6, -1/4), (1/2, -1/4), (1/2, -1/2),
+        (-1/2, -1/2), (-1/2, -1/4), (-1/6, -1/4), (-1/6, 1/2)
+    )
+}
+
+
+def _shape_coords(
+    shape_name: str, width: float, height: float
+) -> t.Tuple[t.Tuple[float, float], ...]:
+    """
+    Return the vertices of a named shape outline scaled to given dimensions.
+
+    :param shape_name: Key into ``_OUTLINES``.
+    :param width: Drawable width of the cell.
+    :param height: Drawable height of the cell.
+    """
+
+    return tuple((x * width, y * height) for x, y in _OUTLINES[shape_name])
+
+
+def _trace(
+    ctx: cairo.Context, points: t.Sequence[t.Tuple[float, float]]
+) -> None:
+    """Move to the first of ``points`` and draw lines through the rest."""
+
+    line_to = ctx.line_to
+    ctx.move_to(*points[0])
+    for point in points[1:]:
+        line_to(*point)
+
+
+@functools.lru_cache(maxsize=64)
+def _about_center(
+    width: float, height: float, factor: float = 1., angle: float = 0.
+) -> cairo.Matrix:
+    """
+    Return a matrix scaling and rotating about the center of a cell.
+
+    The result is equivalent to translating to the center of the cell, 
+    rotating by ``angle``, scaling by ``factor`` and translating back, but 
+    can be applied with a single ``ctx.transform``. Returned matrices are 
+    shared between callers and must not be modified.
+
+    :param width: Width of the cell.
+    :param height: Height of the cell.
+    :param factor: Scaling factor.
+    :param angle: Rotation angle in radians.
+    """
+
+    matrix = cairo.Matrix()
+    matrix.translate(width / 2., height / 2.)
+    matrix.rotate(angle)
+    matrix.scale(factor, factor)
+    matrix.translate(- width / 2., - height / 2.)
+    return matrix
+
+
+@functools.lru_cache(maxsize=64)
+def _grid(
+    number: int, width: float, height: float
+) -> t.Tuple[cairo.Matrix, ...]:
+    """
+    Return matrices laying out ``number`` shrunken copies of a cell on a grid.
+
+    Copies are placed row by row on a 2x2 grid, or on a 3x3 grid if 
+    ``number`` > 4. Returned matrices are shared between callers and must not 
+    be modified.
+
+    :param number: Number of copies, at most 9.
+    :param width: Width of the cell.
+    :param height: Height of the cell.
+    """
+
+    cols = 3 if number > 4 else 2
+    matrices = []
+    for i in range(number):
+        matrix = cairo.Matrix()
+        matrix.translate(
+            (i % cols) * (width / cols), (i // cols) * (height / cols)
+        )
+        matrix.scale(1 / cols, 1 / cols)
+        matrices.append(matrix)
+    return tuple(matrices)
+
+
 ##############
 ### SHAPES ###
 ##############
 
 
+@_cached_path
 def ellipse(
     ctx: cairo.Context, cell_structure: mat.CellStructure, r: float = 2
 ) -> None:
@@ -51,6 +193,7 @@ def ellipse(
     ctx.restore()
 
 
+@_cached_path
 def triangle(ctx, cell_structure, r=1):
     """
     Draw a triangle in the given context.
@@ -73,14 +216,12 @@ def triangle(ctx, cell_structure, r=1):
     ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
     ctx.scale(1 / div, r / div)
     ctx.new_sub_path()
-    ctx.move_to(- width / 2., height / 2.)
-    ctx.line_to(width / 2., height / 2.)
-    ctx.line_to(0, - height / 2.)
-    ctx.line_to(- width / 2., height / 2.)
+    _trace(ctx, _shape_coords('triangle', width, height))
     ctx.close_path()
     ctx.restore()
 
 
+@_cached_path
 def rectangle(ctx, cell_structure, r = 2):
     
     if not r >= 2:
@@ -92,15 +233,12 @@ def rectangle(ctx, cell_structure, r = 2):
     ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
     ctx.scale(1 / r, 1)
     ctx.new_sub_path()
-    ctx.move_to(- width / 2., height / 2.)
-    ctx.line_to(width / 2., height / 2.)
-    ctx.line_to(width / 2., - height / 2.)
-    ctx.line_to(- width / 2., - height / 2.)
-    ctx.line_to(- width / 2., height / 2.)
+    _trace(ctx, _shape_coords('rectangle', width, height))
     ctx.close_path()
     ctx.restore()
 
 
+@_cached_path
 def trapezoid(ctx, cell_structure, r=1):
     
     if not r > 0:        
@@ -114,15 +252,12 @@ def trapezoid(ctx, cell_structure, r=1):
     ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
     ctx.scale(1 / div, r / div)
     ctx.new_sub_path()
-    ctx.move_to(- width / 2., height / 2.)
-    ctx.line_to(width / 2., height / 2.)
-    ctx.line_to(width / 4., - height / 2.)
-    ctx.line_to(- width / 4., - height / 2.)
-    ctx.line_to(- width / 2., height / 2.)
+    _trace(ctx, _shape_coords('trapezoid', width, height))
     ctx.close_path()
     ctx.restore()
 
 
+@_cached_path
 def diamond(ctx, cell_structure, r=1):
     
     if not 1 <= r:        
@@ -134,15 +269,12 @@ def diamond(ctx, cell_structure, r=1):
     ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
     ctx.scale(1 / r, 1)
     ctx.new_sub_path()
-    ctx.move_to(0, height / 2.)
-    ctx.line_to(width / 2., - height / 4.)
-    ctx.line_to(0, - height / 2.)
-    ctx.line_to(- width / 2., - height / 4.)
-    ctx.line_to(0, height / 2.)
+    _trace(ctx, _shape_coords('diamond', width, height))
     ctx.close_path()
     ctx.restore()
 
 
+@_cached_path
 def tee(ctx, cell_structure, r=1):
     
     if not 0 < r:        
@@ -156,15 +288,7 @@ def tee(ctx, cell_structure, r=1):
     ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
     ctx.scale(1 / div, r / div)
     ctx.new_sub_path()
-    ctx.move_to(- width / 6., height / 2.)
-    ctx.line_to(width / 6., height / 2.)
-    ctx.line_to(width / 6., - height / 4.)
-    ctx.line_to(width / 2., - height / 4.)
-    ctx.line_to(width / 2., - height / 2.)
-    ctx.line_to(- width / 2., - height / 2.)
-    ctx.line_to(- width / 2., - height / 4.)
-    ctx.line_to(- width / 6., - height / 4.)
-    ctx.line_to(- width / 6., height / 2.)
+    _trace(ctx, _shape_coords('tee', width, height))
     ctx.close_path()
     ctx.restore()
 
@@ -179,9 +303,11 @@ def scale(element, factor=.5):
     def wrapped(ctx, cell_structure, *args, **kwargs):
 
         ctx.save()
-        ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
-        ctx.scale(factor, factor)
-        ctx.translate(- cell_structure.width / 2., - cell_structure.height / 2.)    
+        ctx.transform(
+            _about_center(
+                cell_structure.width, cell_structure.height, factor=factor
+            )
+        )
         element(ctx, cell_structure, *args, **kwargs)
         ctx.restore()
 
@@ -193,9 +319,11 @@ def rotation(element, angle=math.pi/2.):
     def wrapped(ctx, cell_structure, *args, **kwargs):
 
         ctx.save()
-        ctx.translate(cell_structure.width / 2., cell_structure.height / 2.)
-        ctx.rotate(angle)
-        ctx.translate(-cell_structure.width / 2., -cell_structure.height / 2.)
+        ctx.transform(
+            _about_center(
+                cell_structure.width, cell_structure.height, angle=angle
+            )
+        )
         element(ctx, cell_structure)
         ctx.restore()
         
@@ -218,23 +346,13 @@ def shading(element, lightness=.5):
 def numerosity(element, number=5):
     
     def wrapped(ctx, cell_structure, *args, **kwargs):
-        for i in range(number):
-            if i > 4:                
-                x = (i % 3) * (cell_structure.width / 3.)
-                y = (i // 3) * (cell_structure.height / 3.)
-                
-                ctx.save()
-                ctx.translate(x, y)
-                ctx.scale(1 / 3, 1 / 3)
-            else:                    
-                x = (i % 2) * (cell_structure.width / 2.)
-                y = (i // 2) * (cell_structure.height / 2.)
-                
-                ctx.save()
-                ctx.translate(x, y)
-                ctx.scale(1 / 2, 1 / 2)
+
+        grid = _grid(number, cell_structure.width, cell_structure.height)
+        save, transform, restore = ctx.save, ctx.transform, ctx.restore
+        for matrix in grid:
+            save()
+            transform(matrix)
             element(ctx, cell_structure, *args, **kwargs)
-            ctx.restore()
+            restore()
 
-    
     return wrapped
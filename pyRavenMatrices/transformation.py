@@ -18,10 +18,22 @@ the way an element is drawn**. Thus, transformations are a higher level concept
 in this scheme than modifiers: transformations may add modifiers to or remove 
 modifiers from figures in addition to having other effects such as addition of 
 elements to or removal of elements from figures.
+
+Structure Sharing
+-----------------
+
+Transformations do not copy their input wholesale. The output of a 
+transformation shares every subtree that the transformation leaves untouched 
+with its input; only the altered nodes and their ancestors are new objects. 
+Subtrees that occur more than once in the input, as in 
+``CompositeElement(s, s)``, are copied once and stay shared in the output. 
+If no part of the input is altered, the input itself is returned. Element 
+structures should therefore be treated as immutable once they have been 
+passed to a transformation: alter a copy (see ``Element.clone``) instead.
 '''
 
 
-import copy
+import functools
 from typing import Callable, Any, List, cast
 import pyRavenMatrices.element as elt 
 
@@ -51,22 +63,36 @@ class Target(object):
     
     def __eq__(self, other):
         
+        if not isinstance(other, Target):
+            return NotImplemented
         return (
-            self.attribute == other.attribute,
-            self.index == other.index,
-            self.parent == other.parent,
+            self.attribute == other.attribute and
+            self.index == other.index and
+            self.parent == other.parent and
             self.type == other.type
         )
 
-    def __call__(self, element):
-        
+    def __call__(self, element, cache=None):
+        '''Return the subtree of ``element`` designated by ``self``.
+
+        :param element: Root of the element structure to search.
+        :param cache: Optional dict of previously resolved targets, keyed by 
+            target id. Targets produced by ``get_targets`` share their 
+            parents, so passing the same cache when resolving many targets 
+            against one element avoids re-walking common prefixes.
+        '''
+
+        if cache is not None and id(self) in cache:
+            return cache[id(self)]
         target = element
         if self.parent is not None:
-            target = self.parent(element)
+            target = self.parent(element, cache)
         if self.attribute is not None:
             target = getattr(target, self.attribute)
         if self.index is not None:
             target = target[self.index]
+        if cache is not None:
+            cache[id(self)] = target
         return target
     
     def _repr(self):
@@ -90,6 +116,13 @@ class Target(object):
 
 
 class Transformation(object):
+    '''Alters basic elements and modifiers that match given patterns.
+
+    Each triple ``(target, pattern, value)`` replaces the routine (or 
+    decorator) and params of ``target(element)`` with those in ``value`` 
+    whenever ``target(element) == pattern``. Outputs share unaltered subtrees 
+    with their inputs.
+    '''
     
     def __init__(self, *triples):
         
@@ -97,46 +130,147 @@ class Transformation(object):
         
     def __call__(self, element):
         
-        output = copy.deepcopy(element)
-        for target, pattern, value in self.triples:
-            if target(element) == pattern:
-                if issubclass(target.type, elt.BasicElement):
-                    target(output).routine = value['routine']
-                else:
-                    target(output).decorator = value['decorator']
-                target(output).params = value['params']
+        # Resolved targets in element and output, keyed by target id.
+        found, found_output = {}, {}
+        matches = [
+            (target, value) for target, pattern, value in self.triples
+            if target(element, found) == pattern
+        ]
+        if not matches:
+            return element
+
+        # Collect the nodes leading to every matched target, so that all 
+        # triples are applied with a single copy of the shared ancestors.
+        path = {id(element)}
+        for target, _ in matches:
+            ancestor = target
+            while ancestor is not None:
+                path.add(id(found[id(ancestor)]))
+                ancestor = ancestor.parent
+        output = _copy_along(element, path)
+
+        for target, value in matches:
+            node = target(output, found_output)
+            if issubclass(target.type, elt.BasicElement):
+                node.routine = value['routine']
+            else:
+                node.decorator = value['decorator']
+            node.params = value['params']
         return output
 
 
+def _copy_along(element, path, memo=None):
+    '''Return a copy of element in which only nodes on path are copied.
+
+    :param element: Root of the element structure to copy.
+    :param path: Ids of the nodes of ``element`` that must be copied. 
+        Subtrees whose root is not in ``path`` are reused as-is.
+    :param memo: Copies made so far, keyed by the id of the original. A 
+        subtree reached more than once is copied once, so aliasing within 
+        ``element`` is kept in the copy.
+    '''
+
+    if id(element) not in path:
+        return element
+    if memo is None:
+        memo = {}
+    if id(element) not in memo:
+        memo[id(element)] = _copy_node(element, path, memo)
+    return memo[id(element)]
+
+
+@functools.singledispatch
+def _copy_node(element, path, memo):
+
+    raise TypeError('Unexpected type {}'.format(str(type(element))))
+
+
+@_copy_node.register(elt.BasicElement)
+@_copy_node.register(elt.ElementModifier)
+@_copy_node.register(elt.EmptyElement)
+def _copy_leaf(element, path, memo):
+
+    return element.clone()
+
+
+@_copy_node.register(elt.ModifiedElement)
+def _copy_modified(element, path, memo):
+
+    output = element._shallow_copy()
+    output.element = _copy_along(element.element, path, memo)
+    output.modifiers = tuple(
+        [_copy_along(modifier, path, memo) for modifier in element.modifiers]
+    )
+    return output
+
+
+@_copy_node.register(elt.CompositeElement)
+def _copy_composite(element, path, memo):
+
+    output = element._shallow_copy()
+    output.elements = tuple(
+        [_copy_along(sub, path, memo) for sub in element.elements]
+    )
+    return output
+
+
 def get_targets(element_structure, parent=None):
-    
-    if isinstance(element_structure, (elt.BasicElement, elt.ElementModifier)):
+    '''Return targets for all basic elements and modifiers in a structure.
+
+    Targets are listed in depth-first order.
+    '''
+
+    children = _child_targets(element_structure, parent)
+    if children is None:
         if parent:
             return [parent]
         else:
             return [Target(type=type(element_structure))]
-    elif isinstance(element_structure, elt.ModifiedElement):
-        sub_element = element_structure.element
-        ret = get_targets(
-            sub_element, 
-            parent = Target(
-                'element', 
-                parent = parent, 
-                type = type(sub_element)
-            )
-        )
-        for i, modifier in enumerate(element_structure.modifiers):
-            ret += get_targets(
-                modifier, 
-                Target('modifiers', index=i, parent=parent, type=type(modifier))
-            )
-    elif isinstance(element_structure, elt.CompositeElement):
-        ret = []
-        for i, sub_element in enumerate(element_structure.elements):
-            ret += get_targets(
-                sub_element, 
-                Target(
-                    'elements', index=i, parent=parent, type=type(sub_element)
-                )
-            )
+    ret = []
+    for child, target in children:
+        ret += get_targets(child, target)
     return ret
+
+
+@functools.singledispatch
+def _child_targets(node, target):
+    '''Return ``(child, target)`` pairs for the children of ``node``.
+
+    Returns ``None`` if ``node`` is a leaf.
+    '''
+
+    raise TypeError('Unexpected type {}'.format(str(type(node))))
+
+
+@_child_targets.register(elt.BasicElement)
+@_child_targets.register(elt.ElementModifier)
+def _leaf_targets(node, target):
+
+    return None
+
+
+@_child_targets.register(elt.ModifiedElement)
+def _modified_targets(node, target):
+
+    sub_element = node.element
+    children = [
+        (sub_element, Target('element', parent=target, type=type(sub_element)))
+    ]
+    children.extend(
+        (
+            modifier, 
+            Target('modifiers', index=i, parent=target, type=type(modifier))
+        ) for i, modifier in enumerate(node.modifiers)
+    )
+    return children
+
+
+@_child_targets.register(elt.CompositeElement)
+def _composite_targets(node, target):
+
+    return [
+        (
+            sub_element, 
+            Target('elements', index=i, parent=target, type=type(sub_element))
+        ) for i, sub_element in enumerate(node.elements)
+    ]